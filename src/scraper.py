@@ -1,23 +1,68 @@
 import os
-import json
 import re
-import shutil
-from bs4 import BeautifulSoup as bs
-import requests
-from urllib.parse import urljoin
+import hashlib
+import functools
+import random
+import contextlib
+import uuid
+from email.utils import formatdate
+import orjson
+from bs4 import BeautifulSoup as bs, SoupStrainer
+import soupsieve
 import aiohttp
+import yarl
+import aiofiles
+import aiofiles.os
 import asyncio
 from tqdm.asyncio import tqdm as async_tqdm
 
+try:
+    import uvloop
+except ImportError:  # optional, and not available on Windows
+    uvloop = None
+
+_LAW_ID_RE = re.compile(r'_(\d+|[A-Za-z])\.json$')
+
+# Only the subtrees the scraper reads are built when parsing
+_NAV_STRAINER = SoupStrainer(id="nav_2022")
+_CONTENT_STRAINER = SoupStrainer(id="paddingLR12")
+_PDF_LINK_SELECTOR = soupsieve.compile('a[href][title*="PDF"]')
+
+# Home page nav entries that lead to the alphabetical index of laws
+_LAWS_NAV_LABELS = frozenset({"Gesetze / Verordnungen"})
+
+
+def run_async(coro):
+    """
+    Runs a coroutine to completion on uvloop when it is installed, otherwise on
+    the default asyncio event loop.
+
+    Args:
+        coro (coroutine): Coroutine to run.
+
+    Returns:
+        Any: Result of the coroutine.
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 class LawScraper:
     BASE_URL = "https://www.gesetze-im-internet.de/"
     DIR = "data/"
     HOME_PAGE_LIST_FNAME = "home_page_list.json"
     LAWS_LIST = "laws_list.json"
     ALPHAB_LAWS_LIST_DIR = "laws_list_by_alphabet"
+    HTTP_CACHE_FNAME = "http_cache.json"
+    HTTP_CACHE_DIR = "http_cache"
     PDF_DIR = os.path.join(DIR, "pdf")
     SEMAPHORE_LIMIT = 10
     DELAY_BETWEEN_LAWS = 5
+    POOL_SIZE = 32
+    KEEPALIVE_TIMEOUT = 75
+    REQUEST_TIMEOUT = 60
+    DOWNLOAD_QUEUE_SIZE = 32
 
     def __init__(self, base_url: str = None, dir_path: str = None, home_page_list_fname: str = None, 
                  laws_list_fname: str = None, alphab_laws_list_dir: str = None, pdf_dir: str = None, 
@@ -32,8 +77,10 @@ class LawScraper:
             laws_list_fname (str, optional): Filename for the laws list JSON. Defaults to None.
             alphab_laws_list_dir (str, optional): Directory name for alphabetically categorized law files. Defaults to None.
             pdf_dir (str, optional): Directory where PDFs will be downloaded. Defaults to None.
-            semaphore_limit (int, optional): Limit for simultaneous downloads. Defaults to None.
-            delay_between_laws (int, optional): Delay in seconds between law downloads. Defaults to None.
+            semaphore_limit (int, optional): Limit for simultaneous requests to the site, shared by page
+                fetches and PDF downloads. Defaults to None.
+            delay_between_laws (int, optional): Deprecated and ignored; downloads are throttled by
+                the semaphore only. Defaults to None.
         """
         self.BASE_URL = base_url or self.BASE_URL
         self.DIR = dir_path or self.DIR
@@ -44,24 +91,80 @@ class LawScraper:
         self.SEMAPHORE_LIMIT = semaphore_limit or self.SEMAPHORE_LIMIT
         self.DELAY_BETWEEN_LAWS = delay_between_laws or self.DELAY_BETWEEN_LAWS
 
+        # Parsed once so resolving relative links does not reparse the base URL
+        self._base_url = yarl.URL(self.BASE_URL)
+
         os.makedirs(self.DIR, exist_ok=True)
+        os.makedirs(os.path.join(self.DIR, self.HTTP_CACHE_DIR), exist_ok=True)
+
+        # PDFs are bounded by read inactivity rather than total time, so large files on a
+        # saturated link are not aborted and refetched from scratch
+        self._pdf_timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.REQUEST_TIMEOUT,
+                                                  sock_read=self.REQUEST_TIMEOUT)
+
+        # Bounds concurrent requests across all phases; replaced for every new session
+        self._semaphore = asyncio.BoundedSemaphore(self.SEMAPHORE_LIMIT)
+
+        # Fetches of this run, keyed by (url, parse_only); concurrent callers share one task
+        self._page_cache = {}
+
+        # Validators (ETag/Last-Modified) of earlier responses, keyed by URL
+        self._http_cache = self._load_http_cache()
+
+    @contextlib.asynccontextmanager
+    async def _client_session(self):
+        """
+        Opens an aiohttp session backed by a keep-alive connection pool, together
+        with the semaphore shared by every request made during that session.
+
+        A new connector and semaphore are built per session because both are
+        bound to the running event loop. Pages memoized during the session are
+        evicted when it closes.
+
+        Yields:
+            aiohttp.ClientSession: Session using the pooled connector.
+        """
+        self._semaphore = asyncio.BoundedSemaphore(self.SEMAPHORE_LIMIT)
+        # The pool grows with the semaphore so raising semaphore_limit is not capped by POOL_SIZE
+        connector = aiohttp.TCPConnector(limit=max(self.POOL_SIZE, self.SEMAPHORE_LIMIT),
+                                         limit_per_host=self.SEMAPHORE_LIMIT,
+                                         keepalive_timeout=self.KEEPALIVE_TIMEOUT)
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                yield session
+        finally:
+            self._page_cache.clear()
+
+    def absolute_url(self, href: str) -> str:
+        """
+        Resolves a link relative to the base URL.
+
+        Args:
+            href (str): Relative or absolute link.
+
+        Returns:
+            str: Absolute URL.
+        """
+        return str(self._base_url.join(yarl.URL(href)))
 
-    def list_files_in_directory(self, directory_path: str, exclude_file: str) -> list:
+    def list_files_in_directory(self, directory_path: str, exclude_file: str, suffix: str = None) -> list:
         """
         List all files in the specified directory, excluding a particular file.
 
         Args:
             directory_path (str): Path to the directory.
             exclude_file (str): Filename to exclude from the list.
+            suffix (str, optional): Only list files whose name ends with this suffix. Defaults to None.
 
         Returns:
             list: List of filenames in the directory, excluding the specified file.
         """
         try:
-            files = [f for f in os.listdir(directory_path)
-                     if os.path.isfile(os.path.join(directory_path, f))
-                     and f != exclude_file]
-            return files
+            # DirEntry.is_file() reuses the type from the directory read instead of a stat per file
+            with os.scandir(directory_path) as entries:
+                return [entry.name for entry in entries
+                        if entry.is_file(follow_symlinks=False) and entry.name != exclude_file
+                        and (suffix is None or entry.name.endswith(suffix))]
         except FileNotFoundError:
             print(f"Directory not found: {directory_path}")
             return []
@@ -69,9 +172,12 @@ class LawScraper:
             print(f"Permission denied: {directory_path}")
             return []
 
-    def extract_laws_identifier(self, file_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def extract_laws_identifier(file_name: str) -> str:
         """
-        Extracts the identifier from a law file name.
+        Extracts the identifier from a law file name. Results are memoized since
+        the same handful of file names is looked up by every listing and sort.
 
         Args:
             file_name (str): Name of the file to extract the identifier from.
@@ -79,8 +185,7 @@ class LawScraper:
         Returns:
             str: Extracted identifier or None if no match found.
         """
-        pattern = r'_(\d+|[A-Za-z])\.json$'
-        match = re.search(pattern, file_name)
+        match = _LAW_ID_RE.search(file_name)
         return match.group(1) if match else None
 
     def sort_files(self, files: list) -> list:
@@ -118,16 +223,30 @@ class LawScraper:
         filename = filename.replace('\\', '_')
         return filename
 
-    def write_to_json(self, data: dict, file_name: str) -> None:
+    def write_to_json(self, data: dict, file_name: str, pretty: bool = False) -> None:
         """
-        Writes data to a JSON file.
+        Writes data to a JSON file. The file is left untouched when it already holds
+        exactly the same bytes, which keeps mtimes stable across incremental runs.
 
         Args:
             data (dict): Data to write.
             file_name (str): Name of the output file.
+            pretty (bool, optional): Indent the output for human readers. Defaults to False.
         """
-        with open(os.path.join(self.DIR, file_name), "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        buf = orjson.dumps(data, option=option)
+        path = os.path.join(self.DIR, file_name)
+        try:
+            if os.path.getsize(path) == len(buf):
+                with open(path, "rb") as file:
+                    if file.read() == buf:
+                        return
+        except FileNotFoundError:
+            pass
+        with open(path, "wb") as file:
+            file.write(buf)
 
     def load_json_data(self, file_path: str) -> dict:
         """
@@ -139,49 +258,154 @@ class LawScraper:
         Returns:
             dict: Parsed data from the JSON file.
         """
-        with open(os.path.join(self.DIR, file_path), "r", encoding="utf-8") as file:
-            return json.load(file)
+        with open(os.path.join(self.DIR, file_path), "rb") as file:
+            return orjson.loads(file.read())
 
-    def get_page_object(self, url: str) -> bs:
+    def _load_http_cache(self) -> dict:
         """
-        Fetches and parses an HTML page from the given URL.
+        Loads the HTTP validator cache written by a previous run.
+
+        Returns:
+            dict: Mapping of URL to its ETag, Last-Modified, cached body path and size, or an empty dict.
+        """
+        try:
+            return self.load_json_data(self.HTTP_CACHE_FNAME)
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+
+    def save_http_cache(self) -> None:
+        """
+        Persists the HTTP validator cache so the next run can revalidate instead of refetching.
+
+        Returns:
+            None
+        """
+        self.write_to_json(self._http_cache, self.HTTP_CACHE_FNAME)
+
+    def _page_cache_path(self, url: str) -> str:
+        """
+        Returns the content-addressed path under which the body of a page is cached.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            str: Path of the cached body.
+        """
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.DIR, self.HTTP_CACHE_DIR, f"{digest}.html")
+
+    def _conditional_headers(self, url: str, path: str) -> dict:
+        """
+        Builds conditional request headers for a URL whose body is cached at `path`.
+
+        Args:
+            url (str): URL about to be requested.
+            path (str): Path where the body of the URL is expected on disk.
+
+        Returns:
+            dict: If-None-Match/If-Modified-Since headers, or an empty dict when nothing usable is cached.
+        """
+        if not os.path.isfile(path):
+            return {}
+        entry = self._http_cache.get(url)
+        if not entry:
+            # A file from a run without validators is revalidated against its own mtime
+            return {"If-Modified-Since": formatdate(os.path.getmtime(path), usegmt=True)}
+        if entry["path"] != path:
+            return {}
+        # A file that was truncated or replaced locally must be fetched again in full
+        if entry.get("size") is not None and os.path.getsize(path) != entry["size"]:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _update_http_cache(self, url: str, response: aiohttp.ClientResponse, path: str) -> None:
+        """
+        Records the validators of a successful response whose body was saved to `path`.
+
+        Args:
+            url (str): Requested URL.
+            response (aiohttp.ClientResponse): The response carrying the validators.
+            path (str): Path where the body was saved.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._http_cache[url] = {"etag": etag, "last_modified": last_modified, "path": path,
+                                     "size": os.path.getsize(path)}
+        else:
+            self._http_cache.pop(url, None)
+
+    async def fetch_page(self, url: str, session: aiohttp.ClientSession, parse_only: SoupStrainer = None) -> bs:
+        """
+        Asynchronously fetches and parses an HTML page from the given URL.
 
         Args:
             url (str): URL of the page to fetch.
+            session (aiohttp.ClientSession): The aiohttp session object.
+            parse_only (SoupStrainer, optional): Restricts parsing to the matching elements. Defaults to None.
 
         Returns:
             BeautifulSoup: Parsed HTML page object or None on error.
         """
+        key = (url, parse_only)
+        task = self._page_cache.get(key)
+        if task is None:
+            task = self._page_cache[key] = asyncio.ensure_future(self._fetch_page(url, session, parse_only))
+        # Shielded so one cancelled caller does not cancel the fetch for the others
         try:
-            response = requests.get(url)
-            response.encoding = 'utf-8'
-            response.raise_for_status()
-            return bs(response.content, "html.parser")
-        except requests.RequestException as e:
-            print(f"Error fetching page {url}: {e}")
-            return None
+            page = await asyncio.shield(task)
+        except Exception:
+            self._evict_page(key, task)
+            raise
+        if page is None:
+            self._evict_page(key, task)
+        return page
 
-    async def fetch_page(self, url: str, session: aiohttp.ClientSession) -> bs:
+    def _evict_page(self, key: tuple, task: asyncio.Future) -> None:
         """
-        Asynchronously fetches and parses an HTML page from the given URL.
+        Drops a failed fetch from the in-run page memo so a later caller can try again.
+
+        Args:
+            key (tuple): Memo key of the page.
+            task (asyncio.Future): The task that failed.
+        """
+        if self._page_cache.get(key) is task:
+            del self._page_cache[key]
+
+    async def _fetch_page(self, url: str, session: aiohttp.ClientSession, parse_only: SoupStrainer) -> bs:
+        """
+        Fetches and parses a page, revalidating it against the on-disk HTTP cache.
 
         Args:
             url (str): URL of the page to fetch.
             session (aiohttp.ClientSession): The aiohttp session object.
+            parse_only (SoupStrainer): Restricts parsing to the matching elements.
 
         Returns:
             BeautifulSoup: Parsed HTML page object or None on error.
         """
+        cache_path = self._page_cache_path(url)
         try:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                try:
-                    content = await response.text()
-                except UnicodeDecodeError:
+            async with session.get(url, headers=self._conditional_headers(url, cache_path)) as response:
+                if response.status == 304:
+                    async with aiofiles.open(cache_path, "rb") as file:
+                        content = await file.read()
+                else:
+                    response.raise_for_status()
                     content = await response.read()
-                    content = content.decode('ISO-8859-1')
-                return bs(content, "html.parser")
-        except aiohttp.ClientError as e:
+                    async with aiofiles.open(cache_path, "wb") as file:
+                        await file.write(content)
+                    self._update_http_cache(url, response, cache_path)
+            # Hand the raw bytes to lxml and let it detect the encoding. Tree building runs in a
+            # worker thread so the event loop keeps serving downloads while a page is parsed.
+            return await asyncio.to_thread(bs, content, "lxml", parse_only=parse_only)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"Error fetching page {url}: {e}")
             return None
 
@@ -192,13 +416,35 @@ class LawScraper:
         Returns:
             list: List of dictionaries containing law names and URLs.
         """
-        obj = self.get_page_object(self.BASE_URL)
+        async def run():
+            async with self._client_session() as session:
+                data = await self.async_home_page_list(session)
+            self.save_http_cache()
+            return data
+
+        return run_async(run())
+
+    async def async_home_page_list(self, session: aiohttp.ClientSession) -> list:
+        """
+        Scrapes the home page using an existing session and stores the list in a JSON file.
+
+        Args:
+            session (aiohttp.ClientSession): The aiohttp session object.
+
+        Returns:
+            list: List of dictionaries containing law names and URLs.
+        """
+        obj = await self.fetch_page(self.BASE_URL, session, parse_only=_NAV_STRAINER)
         if obj:
             ulist = obj.find(id="nav_2022")
             if ulist:
                 elements = ulist.find_all("li")
-                data = [{"text": li.find("a").text, "href": li.find("a").get("href")} for li in elements if li.find("a")]
-                self.write_to_json(data, self.HOME_PAGE_LIST_FNAME)
+                data = []
+                for li in elements:
+                    a = li.find("a")
+                    if a:
+                        data.append({"text": a.text, "href": a.get("href")})
+                self.write_to_json(data, self.HOME_PAGE_LIST_FNAME, pretty=True)
                 return data
         raise NavigationElementNotFoundError("Navigation element not found.")
 
@@ -209,23 +455,39 @@ class LawScraper:
         Returns:
             list: List of dictionaries containing law names and URLs.
         """
-        async def async_get_laws_alphabetically_list():
-            async with aiohttp.ClientSession() as session:
-                llist = []
-                home_page_list = self.load_json_data(self.HOME_PAGE_LIST_FNAME)
-                relative_url = home_page_list[0]['href']
-                full_path = urljoin(self.BASE_URL, relative_url)
-                page_object = await self.fetch_page(full_path, session)
-                if page_object:
-                    laws_list = page_object.find(id="content_2022")
-                    if laws_list:
-                        laws_list = laws_list.find(id="paddingLR12")
-                        laws_list = laws_list.find_all('a')
-                        llist = [{"text": a.text, "href": re.sub("./", "", a.get("href"))} for a in laws_list if a]
-                        self.write_to_json(llist, self.LAWS_LIST)
-                return llist
-
-        return asyncio.run(async_get_laws_alphabetically_list())
+        async def run():
+            async with self._client_session() as session:
+                laws_list = await self.async_get_laws_alphabetically_list(session)
+            self.save_http_cache()
+            return laws_list
+
+        return run_async(run())
+
+    async def async_get_laws_alphabetically_list(self, session: aiohttp.ClientSession) -> list:
+        """
+        Fetches the alphabetical index of laws using an existing session.
+
+        Args:
+            session (aiohttp.ClientSession): The aiohttp session object.
+
+        Returns:
+            list: List of dictionaries containing law names and URLs.
+        """
+        llist = []
+        home_page_list = self.load_json_data(self.HOME_PAGE_LIST_FNAME)
+        # Pick the laws entry by its label; fall back to the first entry, as before
+        laws_entry = next((item for item in home_page_list if item['text'].strip() in _LAWS_NAV_LABELS),
+                          home_page_list[0])
+        relative_url = laws_entry['href']
+        full_path = self.absolute_url(relative_url)
+        page_object = await self.fetch_page(full_path, session, parse_only=_CONTENT_STRAINER)
+        if page_object:
+            laws_list = page_object.find(id="paddingLR12")
+            if laws_list:
+                laws_list = laws_list.find_all('a')
+                llist = [{"text": a.text, "href": a.get("href").removeprefix("./")} for a in laws_list if a]
+                self.write_to_json(llist, self.LAWS_LIST)
+        return llist
 
     def get_laws_by_alphabet(self, laws_list: list) -> list:
         """
@@ -237,55 +499,90 @@ class LawScraper:
         Returns:
             list: List of detailed law information.
         """
-        async def async_get_laws_by_alphabet(laws_list):
-            os.makedirs(os.path.join(self.DIR, self.ALPHAB_LAWS_LIST_DIR), exist_ok=True)
-            laws_info = []
+        async def run():
+            async with self._client_session() as session:
+                laws_info = await self.async_get_laws_by_alphabet(laws_list, session)
+            self.save_http_cache()
+            return laws_info
 
-            async with aiohttp.ClientSession() as session:
-                tasks = [self.fetch_law_details(urljoin(self.BASE_URL, law['href']), session, laws_info) for law in laws_list]
-                await asyncio.gather(*tasks)
+        return run_async(run())
 
-            self.write_to_json(laws_info, os.path.join(self.ALPHAB_LAWS_LIST_DIR, 'full_laws_list.json'))
-            return laws_info
+    async def async_get_laws_by_alphabet(self, laws_list: list, session: aiohttp.ClientSession,
+                                         download_queue: asyncio.Queue = None) -> list:
+        """
+        Fetches detailed law information by alphabet using an existing session.
 
-        return asyncio.run(async_get_laws_by_alphabet(laws_list))
+        Args:
+            laws_list (list): List of laws with URLs.
+            session (aiohttp.ClientSession): The aiohttp session object.
+            download_queue (asyncio.Queue, optional): When given, the PDFs of each letter are put on
+                this queue as soon as its page is parsed. Defaults to None.
 
-    async def fetch_law_details(self, url: str, session: aiohttp.ClientSession, laws_info: list) -> None:
+        Returns:
+            list: List of detailed law information.
+        """
+        await asyncio.to_thread(os.makedirs, os.path.join(self.DIR, self.ALPHAB_LAWS_LIST_DIR), exist_ok=True)
+
+        async def fetch_and_queue(url):
+            result = await self.fetch_law_details(url, session)
+            if result and download_queue is not None:
+                law_file_name, each_law = result
+                letter_dir = os.path.join(self.PDF_DIR, self.extract_laws_identifier(os.path.basename(law_file_name)))
+                await asyncio.to_thread(os.makedirs, letter_dir, exist_ok=True)
+                for download in self._pdf_downloads(letter_dir, each_law):
+                    await download_queue.put(download)
+            return result
+
+        tasks = [fetch_and_queue(self.absolute_url(law['href'])) for law in laws_list]
+        results = [result for result in await asyncio.gather(*tasks) if result]
+
+        # Write everything once all pages are in, rather than from inside each task
+        await asyncio.gather(*[asyncio.to_thread(self.write_to_json, each_law, law_file_name)
+                               for law_file_name, each_law in results])
+        laws_info = [law for _, each_law in results for law in each_law]
+        await asyncio.to_thread(self.write_to_json, laws_info,
+                                os.path.join(self.ALPHAB_LAWS_LIST_DIR, 'full_laws_list.json'))
+        return laws_info
+
+    async def fetch_law_details(self, url: str, session: aiohttp.ClientSession) -> tuple:
         """
         Fetches details of individual laws from a URL.
 
         Args:
             url (str): URL of the law.
             session (aiohttp.ClientSession): The aiohttp session object.
-            laws_info (list): List to store the fetched law details.
+
+        Returns:
+            tuple: Name of the per-letter JSON file and the list of law details, or None if the page
+                could not be read.
         """
-        page_object = await self.fetch_page(url, session)
+        async with self._semaphore:
+            page_object = await self.fetch_page(url, session, parse_only=_CONTENT_STRAINER)
         if page_object:
-            table = page_object.find(id="content_2022")
-            if table:
-                table_items_list = table.find(id="paddingLR12")
-                if table_items_list:
-                    table_items = table_items_list.find_all('p')
-                    each_law = []
-                    for item in table_items:
-                        law_link_tag = item.find('a', href=True)
-                        if law_link_tag:
-                            law_webpage_link = urljoin(self.BASE_URL, law_link_tag['href'])
-                            title = law_link_tag.text.strip()
-                            description = law_link_tag.find('abbr')['title'] if law_link_tag.find('abbr') else ''
-
-                            pdf_link_tag = item.find('a', href=True, title=lambda t: t and 'PDF' in t)
-                            pdf_link = urljoin(self.BASE_URL, pdf_link_tag['href']) if pdf_link_tag else None
-
-                            each_law.append({
-                                'webpage_link': law_webpage_link,
-                                'title': title,
-                                'description': description,
-                                'pdf_link': pdf_link
-                            })
-                    laws_info.extend(each_law)
-                    law_file_name = os.path.join(self.ALPHAB_LAWS_LIST_DIR, re.sub(".html", "", url.split("/")[-1]) + ".json")
-                    self.write_to_json(each_law, law_file_name)
+            table_items_list = page_object.find(id="paddingLR12")
+            if table_items_list:
+                table_items = table_items_list.find_all('p')
+                each_law = []
+                for item in table_items:
+                    law_link_tag = item.find('a', href=True)
+                    if law_link_tag:
+                        law_webpage_link = self.absolute_url(law_link_tag['href'])
+                        title = law_link_tag.text.strip()
+                        abbr = law_link_tag.find('abbr')
+                        description = abbr['title'] if abbr else ''
+
+                        pdf_link_tag = _PDF_LINK_SELECTOR.select_one(item)
+                        pdf_link = self.absolute_url(pdf_link_tag['href']) if pdf_link_tag else None
+
+                        each_law.append({
+                            'webpage_link': law_webpage_link,
+                            'title': title,
+                            'description': description,
+                            'pdf_link': pdf_link
+                        })
+                law_file_name = os.path.join(self.ALPHAB_LAWS_LIST_DIR, re.sub(".html", "", url.split("/")[-1]) + ".json")
+                return law_file_name, each_law
+        return None
 
     def display_available_laws(self) -> list:
         """
@@ -294,7 +591,8 @@ class LawScraper:
         Returns:
             list: Sorted list of law files.
         """
-        laws = self.list_files_in_directory(os.path.join(self.DIR, self.ALPHAB_LAWS_LIST_DIR), "full_laws_list.json")
+        laws = self.list_files_in_directory(os.path.join(self.DIR, self.ALPHAB_LAWS_LIST_DIR), "full_laws_list.json",
+                                            suffix=".json")
         sort_law = self.sort_files(laws)
         print("Title \t\t Description")
         for law in sort_law:
@@ -302,7 +600,7 @@ class LawScraper:
             content = self.load_json_data(os.path.join(self.ALPHAB_LAWS_LIST_DIR, law))
             for index, item in enumerate(content):
                 print(f"{index+1} - {item['title']}      {item['description'][:80]} ")
-        return self.sort_files(laws)
+        return sort_law
 
     def download_all_pdfs(self) -> None:
         """
@@ -311,72 +609,134 @@ class LawScraper:
         Returns:
             None
         """
-        async def async_download_all_pdfs():
-            if os.path.exists(self.PDF_DIR):
-                shutil.rmtree(self.PDF_DIR)
-                print(f"Deleted existing directory: {self.PDF_DIR}")
+        async def run():
+            async with self._client_session() as session:
+                await self.async_download_all_pdfs(session)
+            self.save_http_cache()
+
+        run_async(run())
+
+    async def async_download_all_pdfs(self, session: aiohttp.ClientSession) -> None:
+        """
+        Downloads all PDFs related to the laws using an existing session.
+
+        Args:
+            session (aiohttp.ClientSession): The aiohttp session object.
 
+        Returns:
+            None
+        """
+        # Existing PDFs are kept so unchanged files can be revalidated instead of refetched
+        if not os.path.isdir(self.PDF_DIR):
             os.makedirs(self.PDF_DIR, exist_ok=True)
             print(f"Created new directory: {self.PDF_DIR}")
 
-            laws = self.list_files_in_directory(os.path.join(self.DIR, self.ALPHAB_LAWS_LIST_DIR), "full_laws_list.json")
-            sort_law = self.sort_files(laws)
-            semaphore = asyncio.Semaphore(self.SEMAPHORE_LIMIT)
+        laws = self.list_files_in_directory(os.path.join(self.DIR, self.ALPHAB_LAWS_LIST_DIR), "full_laws_list.json",
+                                            suffix=".json")
+        sort_law = self.sort_files(laws)
+
+        letter_dirs = [os.path.join(self.PDF_DIR, self.extract_laws_identifier(law)) for law in sort_law]
+        await asyncio.gather(*[asyncio.to_thread(os.makedirs, path, exist_ok=True) for path in letter_dirs])
 
-            async with aiohttp.ClientSession() as session:
-                for index, law in enumerate(sort_law):
-                    alphabetic_file_name = os.path.join(self.PDF_DIR, self.extract_laws_identifier(law))
-                    os.makedirs(alphabetic_file_name, exist_ok=True)
-                    content = self.load_json_data(os.path.join(self.ALPHAB_LAWS_LIST_DIR, law))
+        # Read all per-letter lists in worker threads instead of one after another on the loop
+        contents = await asyncio.gather(*[asyncio.to_thread(self.load_json_data, os.path.join(self.ALPHAB_LAWS_LIST_DIR, law))
+                                          for law in sort_law])
 
-                    tasks = [self.download_single_pdf(
-                        os.path.join(alphabetic_file_name, f"{self.sanitize_filename(item['title'])}.pdf"),
-                        session,
-                        item['pdf_link'],
-                        semaphore
-                    ) for item in content]
+        # Queue every letter's PDFs at once; the semaphore alone bounds concurrency
+        downloads = []
+        for alphabetic_file_name, content in zip(letter_dirs, contents):
+            downloads.extend(self._pdf_downloads(alphabetic_file_name, content))
 
-                    for task in async_tqdm(asyncio.as_completed(tasks), total=len(tasks)):
-                        await task
+        tasks = [self.download_single_pdf(pdf_path, session, pdf_link, self._semaphore) for pdf_path, pdf_link in downloads]
+        await async_tqdm.gather(*tasks)
 
-                    if index < len(sort_law) - 1:
-                        await asyncio.sleep(self.DELAY_BETWEEN_LAWS)
+    def _pdf_downloads(self, letter_dir: str, laws: list) -> list:
+        """
+        Lists the PDFs to download for the laws of one letter.
 
-        asyncio.run(async_download_all_pdfs())
+        Args:
+            letter_dir (str): Directory the letter's PDFs are saved to.
+            laws (list): Law details of the letter.
 
-    async def download_single_pdf(self, pdf_path: str, session: aiohttp.ClientSession, pdf_link: str, 
-                                  semaphore: asyncio.Semaphore, retries: int = 0, max_retries: int = 5) -> None:
+        Returns:
+            list: (pdf_path, pdf_link) tuples for every law that has a PDF.
+        """
+        return [(os.path.join(letter_dir, f"{self.sanitize_filename(item['title'])}.pdf"), item['pdf_link'])
+                for item in laws if item['pdf_link']]
+
+    async def _download_worker(self, queue: asyncio.Queue, session: aiohttp.ClientSession, progress) -> None:
+        """
+        Downloads PDFs taken from the queue until cancelled.
+
+        Args:
+            queue (asyncio.Queue): Queue of (pdf_path, pdf_link) tuples.
+            session (aiohttp.ClientSession): The aiohttp session object.
+            progress (tqdm): Progress bar advanced once per finished PDF.
+        """
+        while True:
+            pdf_path, pdf_link = await queue.get()
+            try:
+                await self.download_single_pdf(pdf_path, session, pdf_link, self._semaphore)
+            finally:
+                progress.update(1)
+                queue.task_done()
+
+    async def download_single_pdf(self, pdf_path: str, session: aiohttp.ClientSession, pdf_link: str,
+                                  semaphore: asyncio.Semaphore, max_retries: int = 5) -> None:
         """
         Asynchronously downloads a single PDF with retry logic.
 
+        Each attempt holds the semaphore only while it is talking to the server;
+        the backoff between attempts happens outside of it.
+
         Args:
             pdf_path (str): Path to save the PDF.
             session (aiohttp.ClientSession): The aiohttp session object.
             pdf_link (str): URL of the PDF.
             semaphore (asyncio.Semaphore): Semaphore to control concurrent downloads.
-            retries (int, optional): Number of retries. Defaults to 0.
             max_retries (int, optional): Maximum number of retries. Defaults to 5.
 
         Returns:
             None
         """
-        async with semaphore:
-            try:
-                async with session.get(pdf_link, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                    if response.status == 200:
-                        with open(pdf_path, 'wb') as f:
-                            f.write(await response.read())
-                    else:
-                        print(f"Failed to download {pdf_link}: Status {response.status}")
-            except aiohttp.ClientOSError as e:
-                if retries < max_retries:
-                    print(f"Retry {retries + 1} for {pdf_link} after error: {e}")
-                    await asyncio.sleep(2 ** retries)  # Exponential backoff
-                    await self.download_single_pdf(pdf_path, session, pdf_link, semaphore, retries + 1)
-                else:
-                    print(f"Failed to download {pdf_link} after {max_retries} retries")
-            except Exception as e:
-                print(f"Unexpected error for {pdf_link}: {e}")
+        for attempt in range(max_retries + 1):
+            async with semaphore:
+                try:
+                    async with session.get(pdf_link, headers=self._conditional_headers(pdf_link, pdf_path),
+                                           timeout=self._pdf_timeout) as response:
+                        if response.status == 304:
+                            return
+                        if response.status == 200:
+                            # Stream to disk as buffers arrive, so memory stays bounded by what is in
+                            # flight, into a temporary file so an interrupted download never replaces a good PDF.
+                            # Laws whose titles sanitize to the same name share pdf_path, so every attempt
+                            # gets its own temporary file next to it.
+                            part_path = f"{pdf_path}.{uuid.uuid4().hex}.part"
+                            try:
+                                async with aiofiles.open(part_path, 'wb') as f:
+                                    async for chunk in response.content.iter_any():
+                                        await f.write(chunk)
+                                await aiofiles.os.replace(part_path, pdf_path)
+                            except BaseException:
+                                # Also on cancellation, so failed runs leave no partial files in PDF_DIR
+                                with contextlib.suppress(FileNotFoundError):
+                                    await aiofiles.os.remove(part_path)
+                                raise
+                            self._update_http_cache(pdf_link, response, pdf_path)
+                        else:
+                            print(f"Failed to download {pdf_link}: Status {response.status}")
+                    return
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+                except Exception as e:
+                    print(f"Unexpected error for {pdf_link}: {e}")
+                    return
+
+            if attempt < max_retries:
+                print(f"Retry {attempt + 1} for {pdf_link} after error: {error}")
+                await asyncio.sleep(min(2 ** attempt + random.random(), 30))  # Exponential backoff with jitter
+
+        print(f"Failed to download {pdf_link} after {max_retries} retries")
 
     def start_download(self) -> None:
         """
@@ -385,10 +745,36 @@ class LawScraper:
         Returns:
             None
         """
-        self.home_page_list()
-        laws_list = self.get_laws_alphabetically_list()
-        self.get_laws_by_alphabet(laws_list=laws_list)
-        self.download_all_pdfs()
+        run_async(self._run_all())
+
+    async def _run_all(self) -> None:
+        """
+        Runs the asynchronous scraping phases over one shared aiohttp session,
+        so the connection pool and DNS cache survive from phase to phase.
+
+        Letter pages and PDF downloads are pipelined: a bounded queue carries the
+        PDFs of each letter to the download workers as soon as its page is parsed,
+        so downloads start while the remaining letter pages are still being fetched.
+
+        Returns:
+            None
+        """
+        async with self._client_session() as session:
+            await self.async_home_page_list(session)
+            laws_list = await self.async_get_laws_alphabetically_list(session)
+
+            queue = asyncio.Queue(maxsize=self.DOWNLOAD_QUEUE_SIZE)
+            with async_tqdm(unit="pdf") as progress:
+                workers = [asyncio.create_task(self._download_worker(queue, session, progress))
+                           for _ in range(self.SEMAPHORE_LIMIT)]
+                try:
+                    await self.async_get_laws_by_alphabet(laws_list, session, download_queue=queue)
+                    await queue.join()
+                finally:
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+        self.save_http_cache()
 
 
 class NavigationElementNotFoundError(Exception):
@@ -4,12 +4,37 @@ import json
 import aiohttp
 import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
-from src.scraper import LawScraper, NavigationElementNotFoundError
+from src.scraper import LawScraper, NavigationElementNotFoundError, run_async
 from bs4 import BeautifulSoup
 
+async def async_iter(items):
+    for item in items:
+        yield item
+
+def mock_response(status=200, headers=None, body=b'', chunks=()):
+    # An aiohttp response: read() returns body, content.iter_any() streams chunks
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=body)
+    response.content.iter_any = lambda: async_iter(chunks)
+    return response
+
+def mock_session(*responses):
+    # A session whose get() yields the given responses, or raises the given errors, one per request
+    session = MagicMock()
+    session.get.return_value.__aenter__.side_effect = list(responses)
+    return session
+
 @pytest.fixture
-def scraper():
-    return LawScraper()
+def scraper(tmp_path):
+    return LawScraper(dir_path=str(tmp_path))
+
+@pytest.fixture
+async def session(scraper):
+    # The same pooled session the scraper shares across all of its phases
+    async with scraper._client_session() as session:
+        yield session
 
 def test_list_files_in_directory(scraper):
     # Setup
@@ -21,13 +46,13 @@ def test_list_files_in_directory(scraper):
     # Test
     result = scraper.list_files_in_directory(test_dir, 'exclude_file.json')
     assert 'test_file.json' in result
+    assert scraper.list_files_in_directory(test_dir, 'exclude_file.json', suffix='.pdf') == []
 
     # Teardown
     os.remove(os.path.join(test_dir, 'test_file.json'))
     os.rmdir(test_dir)
 
-def test_extract_laws_identifier():
-    scraper = LawScraper()
+def test_extract_laws_identifier(scraper):
     result = scraper.extract_laws_identifier('law_123.json')
     assert result == '123'
     result = scraper.extract_laws_identifier('law_A.json')
@@ -35,63 +60,101 @@ def test_extract_laws_identifier():
     result = scraper.extract_laws_identifier('law.json')
     assert result is None
 
-@patch('src.scraper.requests.get')
-def test_get_page_object(mock_get):
-    scraper = LawScraper()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.content = b'<html></html>'
-    mock_get.return_value = mock_response
+def test_sort_files_orders_by_identifier(scraper):
+    files = ['Teilliste_2.json', 'notes.json', 'Teilliste_B.json', 'Teilliste_10.json', 'Teilliste_A.json']
+    result = scraper.sort_files(files)
+    assert result == ['Teilliste_A.json', 'Teilliste_B.json', 'Teilliste_2.json', 'Teilliste_10.json', 'notes.json']
 
-    soup = scraper.get_page_object('http://example.com')
-    assert soup is not None
+@pytest.mark.asyncio
+async def test_async_home_page_list(scraper):
+    session = mock_session(mock_response(body=b'''<html><body><div id="nav_2022"><ul>
+        <li><a href="aktuell.html">Gesetze / Verordnungen</a></li>
+        <li><span><a href="titel.html">Titelsuche</a></span><a href="extra.html">Extra</a></li>
+    </ul></div></body></html>'''))
+
+    result = await scraper.async_home_page_list(session)
+
+    # Wrapped links are found, and only the first link of each item is taken
+    assert session.get.call_args.args[0] == scraper.BASE_URL
+    assert result == [{'text': 'Gesetze / Verordnungen', 'href': 'aktuell.html'},
+                      {'text': 'Titelsuche', 'href': 'titel.html'}]
+    assert scraper.load_json_data(scraper.HOME_PAGE_LIST_FNAME) == result
 
 
-@patch('src.scraper.aiohttp.ClientSession.get')
 @pytest.mark.asyncio
-async def test_fetch_page(mock_get):
-    scraper = LawScraper()
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.text = AsyncMock(return_value='<html></html>')
-    mock_get.return_value = mock_response
-    
-    # Adjust the mock to return BeautifulSoup directly
-    html_content = await mock_response.text()
-    expected_soup = BeautifulSoup(html_content, 'html.parser')
-
-    # Mock fetch_page to return the BeautifulSoup object
-    with patch.object(scraper, 'fetch_page', return_value=expected_soup):
-        soup = await scraper.fetch_page('http://example.com', MagicMock())
-    
-    # Test if the returned object is BeautifulSoup and not None
+async def test_fetch_page(scraper):
+    html_content = b'<html><body><p>Gesetz</p></body></html>'
+    session = mock_session(mock_response(body=html_content))
+    expected_soup = BeautifulSoup(html_content, 'lxml')
+
+    soup = await scraper.fetch_page('http://example.com', session)
+
+    # Test if the returned object is BeautifulSoup built by lxml from the raw bytes
     assert isinstance(soup, BeautifulSoup)
-    assert soup.prettify() == expected_soup.prettify()
-
-from unittest.mock import patch, MagicMock
-
-@patch('src.scraper.LawScraper.fetch_page')
-def test_home_page_list(mock_fetch_page):
-    scraper = LawScraper()
-    
-    # Create mock BeautifulSoup object
-    mock_soup = MagicMock()
-    mock_ul = MagicMock()
-    mock_li = MagicMock()
-    mock_a = MagicMock()
-    
-    # Configure mock behavior
-    mock_a.text = 'Gesetze / Verordnungen'
-    mock_a.get.return_value = 'aktuell.html'
-    mock_li.find.return_value = mock_a
-    mock_ul.find_all.return_value = [mock_li]  # Simulate a list of items
-    mock_soup.find.return_value = mock_ul
-    mock_fetch_page.return_value = mock_soup
-    
+    assert soup.builder.NAME == 'lxml'
+    assert str(soup) == str(expected_soup)
+
+@pytest.mark.asyncio
+async def test_fetch_page_revalidates_cached_page(scraper):
+    url = 'https://www.gesetze-im-internet.de/aktuell.html'
+
+    session = mock_session(mock_response(headers={'ETag': '"abc"'}, body=b'<html><body><p>cached</p></body></html>'),
+                           mock_response(status=304))
+
+    await scraper.fetch_page(url, session)
+    scraper._page_cache.clear()  # as on the next run
+    soup = await scraper.fetch_page(url, session)
+
+    # The second request is conditional and its body comes from the on-disk cache
+    assert session.get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}
+    assert soup.p.text == 'cached'
+
+@pytest.mark.asyncio
+async def test_fetch_page_memoizes_parsed_pages(scraper):
+    session = mock_session(*[mock_response(body=b'<html></html>') for _ in range(2)])
+
+    first = await scraper.fetch_page('http://example.com', session)
+    second = await scraper.fetch_page('http://example.com', session)
+
+    assert first is second
+    assert session.get.call_count == 1
+
+    # Concurrent callers for a page not fetched yet share one request
+    scraper._page_cache.clear()
+    third, fourth = await asyncio.gather(scraper.fetch_page('http://example.com', session),
+                                         scraper.fetch_page('http://example.com', session))
+    assert third is fourth
+    assert session.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_fetch_page_retries_after_failed_fetch(scraper):
+    session = mock_session(asyncio.TimeoutError(), mock_response(body=b'<html><body><p>Gesetz</p></body></html>'))
+
+    assert await scraper.fetch_page('http://example.com', session) is None
+    soup = await scraper.fetch_page('http://example.com', session)
+
+    assert soup.p.text == 'Gesetz'
+    assert session.get.call_count == 2
+
+    # A fetch that raises is not memoized either
+    with patch.object(scraper, '_fetch_page', AsyncMock(side_effect=[RuntimeError('boom'), soup])):
+        with pytest.raises(RuntimeError):
+            await scraper.fetch_page('http://example.org', session)
+        assert await scraper.fetch_page('http://example.org', session) is soup
+
+@patch('src.scraper.LawScraper.fetch_page', new_callable=AsyncMock)
+def test_home_page_list(mock_fetch_page, scraper):
+
+    # Only the nav subtree is parsed, as with the SoupStrainer used in production
+    mock_fetch_page.return_value = BeautifulSoup('''<div id="nav_2022"><ul>
+        <li><a href="aktuell.html">Gesetze / Verordnungen</a></li>
+        <li>no link</li>
+    </ul></div>''', 'lxml')
+
     result = []
     # Call the method
     result.append(scraper.home_page_list()[0])
-    
+
     # Define the expected result based on the mock setup
     expected = [{'text': 'Gesetze / Verordnungen', 'href': 'aktuell.html'}]
     assert result == expected
@@ -99,14 +162,9 @@ def test_home_page_list(mock_fetch_page):
 
 @patch('src.scraper.aiohttp.ClientSession.get')
 @pytest.mark.asyncio
-async def test_download_single_pdf(mock_get):
-    scraper = LawScraper()
-
-    # Create a mock response object
-    mock_response = MagicMock()
-    mock_response.status = 200  # Ensure this is a normal int, not an AsyncMock
-    mock_response.read = AsyncMock(return_value=b'%PDF-1.4...')  # Simulate PDF content
-    mock_get.return_value.__aenter__.return_value = mock_response
+async def test_download_single_pdf(mock_get, scraper, session):
+    # Create a mock response object that streams the PDF content
+    mock_get.return_value.__aenter__.return_value = mock_response(chunks=[b'%PDF-1.4', b'...'])
 
     pdf_path = 'tests/test_file.pdf'
 
@@ -115,8 +173,7 @@ async def test_download_single_pdf(mock_get):
         os.remove(pdf_path)
 
     # Call the method
-    async with aiohttp.ClientSession() as session:
-        await scraper.download_single_pdf(pdf_path, session, 'https://www.gesetze-im-internet.de/stgb/StGB.pdf', asyncio.Semaphore(1))
+    await scraper.download_single_pdf(pdf_path, session, 'https://www.gesetze-im-internet.de/stgb/StGB.pdf', asyncio.Semaphore(1))
 
     # Verify file was created
     assert os.path.isfile(pdf_path)
@@ -128,4 +185,233 @@ async def test_download_single_pdf(mock_get):
 
     # Clean up
     if os.path.isfile(pdf_path):
-        os.remove(pdf_path)
\ No newline at end of file
+        os.remove(pdf_path)
+
+@pytest.mark.asyncio
+async def test_download_single_pdf_refetches_truncated_file(scraper, tmp_path):
+    pdf_link = 'https://www.gesetze-im-internet.de/stgb/StGB.pdf'
+    pdf_path = str(tmp_path / 'StGB.pdf')
+    with open(pdf_path, 'wb') as f:
+        f.write(b'%PDF')
+    scraper._http_cache[pdf_link] = {'etag': '"abc"', 'last_modified': None, 'path': pdf_path, 'size': 1024}
+
+    session = mock_session(mock_response(headers={'ETag': '"abc"'}, chunks=[b'%PDF-1.4', b'...']))
+
+    await scraper.download_single_pdf(pdf_path, session, pdf_link, asyncio.Semaphore(1))
+
+    # The on-disk size no longer matches the cache entry, so no validators are sent
+    assert session.get.call_args.kwargs['headers'] == {}
+    assert scraper._http_cache[pdf_link]['size'] == len(b'%PDF-1.4...')
+
+
+@pytest.mark.asyncio
+async def test_download_single_pdf_retries_without_holding_semaphore(scraper, tmp_path):
+    pdf_path = str(tmp_path / 'StGB.pdf')
+    semaphore = asyncio.Semaphore(1)
+
+    session = mock_session(aiohttp.ClientOSError(), mock_response(chunks=[b'%PDF-1.4']))
+
+    async def fake_sleep(delay):
+        assert not semaphore.locked()
+
+    with patch('src.scraper.asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+        await scraper.download_single_pdf(pdf_path, session, 'https://www.gesetze-im-internet.de/stgb/StGB.pdf', semaphore)
+
+    assert mock_sleep.call_count == 1
+    assert session.get.call_count == 2
+    with open(pdf_path, 'rb') as f:
+        assert f.read() == b'%PDF-1.4'
+
+
+@pytest.mark.asyncio
+async def test_fetch_law_details_returns_letter_file_and_laws(scraper):
+    html = b'''<html><body><div id="content_2022"><div id="paddingLR12">
+        <p><a href="./stgb/index.html"><abbr title="Strafgesetzbuch">StGB</abbr></a>
+           <a href="./stgb/StGB.pdf" title="PDF-Datei">PDF</a></p>
+        <p>no link here</p>
+    </div></div></body></html>'''
+
+    with patch.object(scraper, 'fetch_page', AsyncMock(return_value=BeautifulSoup(html, 'lxml'))):
+        law_file_name, laws = await scraper.fetch_law_details('https://www.gesetze-im-internet.de/Teilliste_A.html', MagicMock())
+
+    assert law_file_name == os.path.join(scraper.ALPHAB_LAWS_LIST_DIR, 'Teilliste_A.json')
+    assert laws == [{
+        'webpage_link': 'https://www.gesetze-im-internet.de/stgb/index.html',
+        'title': 'StGB',
+        'description': 'Strafgesetzbuch',
+        'pdf_link': 'https://www.gesetze-im-internet.de/stgb/StGB.pdf',
+    }]
+
+
+def test_write_to_json_skips_identical_content(scraper, tmp_path):
+    data = [{'title': 'StGB', 'description': 'Strafgesetzbuch'}]
+    scraper.write_to_json(data, 'laws.json')
+    path = tmp_path / 'laws.json'
+    os.utime(path, (0, 0))
+
+    scraper.write_to_json(data, 'laws.json')
+    assert os.path.getmtime(path) == 0
+
+    scraper.write_to_json(data + data, 'laws.json')
+    assert os.path.getmtime(path) != 0
+    assert scraper.load_json_data('laws.json') == data + data
+
+
+@pytest.mark.asyncio
+async def test_download_single_pdf_keeps_previous_file_when_interrupted(scraper, tmp_path):
+    pdf_path = str(tmp_path / 'StGB.pdf')
+    with open(pdf_path, 'wb') as f:
+        f.write(b'%PDF-old')
+
+    async def broken_stream():
+        yield b'%PDF-new'
+        raise aiohttp.ClientPayloadError('connection reset')
+
+    response = mock_response()
+    response.content.iter_any = broken_stream
+    session = mock_session(response)
+
+    await scraper.download_single_pdf(pdf_path, session, 'https://www.gesetze-im-internet.de/stgb/StGB.pdf',
+                                      asyncio.Semaphore(1), max_retries=0)
+
+    with open(pdf_path, 'rb') as f:
+        assert f.read() == b'%PDF-old'
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
+
+
+@pytest.mark.asyncio
+async def test_download_single_pdf_same_target_concurrently(scraper, tmp_path):
+    pdf_path = str(tmp_path / 'StGB.pdf')
+
+    session = mock_session(mock_response(chunks=[b'%PDF-', b'first']), mock_response(chunks=[b'%PDF-', b'second']))
+
+    # Two laws whose titles sanitize to the same file name
+    with patch('builtins.print') as mock_print:
+        await asyncio.gather(*[scraper.download_single_pdf(pdf_path, session, f'https://example.com/{i}.pdf',
+                                                           asyncio.Semaphore(2)) for i in range(2)])
+
+    mock_print.assert_not_called()
+    with open(pdf_path, 'rb') as f:
+        assert f.read() in (b'%PDF-first', b'%PDF-second')
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
+
+
+@pytest.mark.asyncio
+async def test_async_download_all_pdfs_queues_every_letter(scraper, tmp_path):
+    os.makedirs(tmp_path / scraper.ALPHAB_LAWS_LIST_DIR)
+    scraper.write_to_json([{'title': 'StGB', 'pdf_link': 'https://example.com/StGB.pdf'}],
+                          os.path.join(scraper.ALPHAB_LAWS_LIST_DIR, 'Teilliste_S.json'))
+    scraper.write_to_json([{'title': 'AO', 'pdf_link': 'https://example.com/AO.pdf'},
+                           {'title': 'No PDF', 'pdf_link': None}],
+                          os.path.join(scraper.ALPHAB_LAWS_LIST_DIR, 'Teilliste_A.json'))
+
+    with patch.object(scraper, 'download_single_pdf', AsyncMock()) as mock_download:
+        await scraper.async_download_all_pdfs(MagicMock())
+
+    downloaded = sorted((call.args[0], call.args[2]) for call in mock_download.call_args_list)
+    assert downloaded == [
+        (os.path.join(scraper.PDF_DIR, 'A', 'AO.pdf'), 'https://example.com/AO.pdf'),
+        (os.path.join(scraper.PDF_DIR, 'S', 'StGB.pdf'), 'https://example.com/StGB.pdf'),
+    ]
+    assert os.path.isdir(os.path.join(scraper.PDF_DIR, 'A'))
+
+
+@pytest.mark.asyncio
+async def test_download_single_pdf_keeps_file_on_not_modified(scraper, tmp_path):
+    pdf_path = str(tmp_path / 'StGB.pdf')
+    with open(pdf_path, 'wb') as f:
+        f.write(b'%PDF-1.4 unchanged')
+    os.utime(pdf_path, (784111777, 784111777))
+
+    session = mock_session(mock_response(status=304))
+
+    await scraper.download_single_pdf(pdf_path, session, 'https://www.gesetze-im-internet.de/stgb/StGB.pdf', asyncio.Semaphore(1))
+
+    # Without a stored validator the file's mtime is used for the conditional request
+    assert session.get.call_args.kwargs['headers'] == {'If-Modified-Since': 'Sun, 06 Nov 1994 08:49:37 GMT'}
+    with open(pdf_path, 'rb') as f:
+        assert f.read() == b'%PDF-1.4 unchanged'
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
+
+
+@pytest.mark.asyncio
+async def test_async_download_all_pdfs_runs_downloads_concurrently(tmp_path):
+    scraper = LawScraper(dir_path=str(tmp_path), semaphore_limit=2)
+    os.makedirs(tmp_path / scraper.ALPHAB_LAWS_LIST_DIR)
+    for letter in 'ABC':
+        scraper.write_to_json([{'title': f'{letter}{i}', 'pdf_link': f'https://example.com/{letter}{i}.pdf'} for i in range(2)],
+                              os.path.join(scraper.ALPHAB_LAWS_LIST_DIR, f'Teilliste_{letter}.json'))
+
+    in_flight = 0
+    peak = 0
+
+    class Request:
+        async def __aenter__(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            return mock_response(status=304)
+
+        async def __aexit__(self, *exc):
+            nonlocal in_flight
+            in_flight -= 1
+
+    session = MagicMock()
+    session.get.side_effect = lambda *args, **kwargs: Request()
+
+    await scraper.async_download_all_pdfs(session)
+
+    # PDFs of different letters overlap, but never beyond the semaphore limit
+    assert session.get.call_count == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_run_all_pipes_letter_pages_into_downloads(scraper):
+    laws_list = [{'text': 'A', 'href': 'Teilliste_A.html'}, {'text': 'B', 'href': 'Teilliste_B.html'}]
+
+    async def fake_fetch_law_details(url, session):
+        letter = url[-6]
+        law_file_name = os.path.join(scraper.ALPHAB_LAWS_LIST_DIR, f'Teilliste_{letter}.json')
+        return law_file_name, [{'title': f'{letter}G', 'description': '', 'webpage_link': url,
+                                'pdf_link': f'https://example.com/{letter}G.pdf'}]
+
+    with patch.object(scraper, 'async_home_page_list', AsyncMock()), \
+         patch.object(scraper, 'async_get_laws_alphabetically_list', AsyncMock(return_value=laws_list)), \
+         patch.object(scraper, 'fetch_law_details', side_effect=fake_fetch_law_details), \
+         patch.object(scraper, 'download_single_pdf', AsyncMock()) as mock_download:
+        await scraper._run_all()
+
+    downloaded = sorted(call.args[2] for call in mock_download.call_args_list)
+    assert downloaded == ['https://example.com/AG.pdf', 'https://example.com/BG.pdf']
+    assert os.path.isdir(os.path.join(scraper.PDF_DIR, 'B'))
+    assert len(scraper.load_json_data(os.path.join(scraper.ALPHAB_LAWS_LIST_DIR, 'full_laws_list.json'))) == 2
+
+
+def test_run_async_prefers_uvloop_when_installed():
+    async def answer():
+        return 42
+
+    with patch('src.scraper.uvloop', None):
+        assert run_async(answer()) == 42
+
+    mock_uvloop = MagicMock()
+    mock_uvloop.run.side_effect = asyncio.run
+    with patch('src.scraper.uvloop', mock_uvloop):
+        assert run_async(answer()) == 42
+    mock_uvloop.run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_get_laws_alphabetically_list_follows_laws_nav_entry(scraper):
+    scraper.write_to_json([{'text': 'Aktuelles', 'href': 'news.html'},
+                           {'text': ' Gesetze / Verordnungen ', 'href': 'aktuell.html'}],
+                          scraper.HOME_PAGE_LIST_FNAME)
+    page = BeautifulSoup('<div id="paddingLR12"><a href="./Teilliste_A.html">A</a></div>', 'lxml')
+
+    with patch.object(scraper, 'fetch_page', AsyncMock(return_value=page)) as mock_fetch_page:
+        result = await scraper.async_get_laws_alphabetically_list(MagicMock())
+
+    assert mock_fetch_page.call_args.args[0] == 'https://www.gesetze-im-internet.de/aktuell.html'
+    assert result == [{'text': 'A', 'href': 'Teilliste_A.html'}]